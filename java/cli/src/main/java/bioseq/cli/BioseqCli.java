@@ -13,11 +13,16 @@ import bioseq.pairwise.global.OptimalAlignmentCounter;
 import bioseq.pairwise.model.AlignmentResult;
 import bioseq.pairwise.parallel.WavefrontAffineAligner;
 import bioseq.pairwise.parallel.WavefrontLinearAligner;
+import java.io.BufferedReader;
 import java.io.IOException;
+import java.io.InputStreamReader;
+import java.io.PrintStream;
 import java.math.BigInteger;
 import java.nio.charset.StandardCharsets;
 import java.nio.file.Files;
 import java.nio.file.Path;
+import java.util.HashMap;
+import java.util.Map;
 import picocli.CommandLine;
 import picocli.CommandLine.Command;
 import picocli.CommandLine.Model.CommandSpec;
@@ -33,6 +38,7 @@ import picocli.CommandLine.Spec;
  *   <li>{@link GlobalLinearCommand} computes cost and optional traceback output.</li>
  *   <li>{@link GlobalCountCommand} computes optimal cost and number of optimal alignments.</li>
  *   <li>{@link GlobalAffineCommand} computes affine-gap cost/count and optional traceback output.</li>
+ *   <li>{@link ServerCommand} keeps one JVM alive and answers timed linear-gap requests from stdin.</li>
  *   <li>{@link BaseCommand} centralizes shared argument parsing and I/O handling.</li>
  *   <li>{@link AffineBaseCommand} centralizes shared affine command parsing and I/O handling.</li>
  * </ul>
@@ -43,7 +49,8 @@ import picocli.CommandLine.Spec;
     subcommands = {
         BioseqCli.GlobalLinearCommand.class,
         BioseqCli.GlobalCountCommand.class,
-        BioseqCli.GlobalAffineCommand.class
+        BioseqCli.GlobalAffineCommand.class,
+        BioseqCli.ServerCommand.class
     })
 public final class BioseqCli implements Runnable {
   /** Utility-style root command holder; instantiation is managed internally. */
@@ -68,33 +75,62 @@ public final class BioseqCli implements Runnable {
     CommandLine.usage(this, System.err);
   }
 
+  /**
+   * Creates the linear-gap aligner used for a given worker count.
+   *
+   * @param threads worker threads; {@code 1} selects the sequential aligner
+   * @return sequential aligner for one thread, wavefront aligner otherwise
+   */
+  static GlobalAligner<LinearGapCost> linearAligner(int threads) {
+    if (threads > 1) {
+      return new WavefrontLinearAligner(threads);
+    }
+    return new GlobalLinearAligner();
+  }
+
   @Command(name = "global_linear", mixinStandardHelpOptions = true,
       description = "Compute min-cost global alignment with linear gap penalty.")
   static final class GlobalLinearCommand extends BaseCommand implements Runnable {
     @Option(names = "--traceback", description = "Include aligned strings in output.")
     boolean traceback;
 
+    @Option(names = "--timing",
+        description = "Also print runtime_ns=<n> to stderr: the cost computation, or the full align call "
+            + "(DP, traceback, aligned strings) with --traceback.")
+    boolean timing;
+
+    @Option(names = "--quiet", description = "Suppress the cost/alignment output (useful with --timing).")
+    boolean quiet;
+
     /** Executes the {@code global_linear} subcommand pipeline. */
     @Override
     public void run() {
       Inputs inputs = resolveInputs();
       ScoreMatrix matrix = ScoreMatrix.fromPhylipLikeFile(matrixPath);
       LinearGapCost gapCost = new LinearGapCost(gap);
-      GlobalAligner<LinearGapCost> aligner;
       if (threads > 1) {
         System.err.println("Using wavefront parallelism with " + threads + " threads");
-        aligner = new WavefrontLinearAligner(threads);
-      } else {
-        aligner = new GlobalLinearAligner();
       }
+      GlobalAligner<LinearGapCost> aligner = linearAligner(threads);
 
       if (!traceback) {
+        long start = System.nanoTime();
         int cost = aligner.computeCost(inputs.seq1, inputs.seq2, matrix, gapCost);
-        writeOutput(Integer.toString(cost));
+        long elapsedNs = System.nanoTime() - start;
+        if (!quiet) {
+          writeOutput(Integer.toString(cost));
+        }
+        reportTiming(elapsedNs);
         return;
       }
 
+      long start = System.nanoTime();
       AlignmentResult result = aligner.align(inputs.seq1, inputs.seq2, matrix, gapCost);
+      long elapsedNs = System.nanoTime() - start;
+      if (quiet) {
+        reportTiming(elapsedNs);
+        return;
+      }
       StringBuilder outBuilder = new StringBuilder();
       outBuilder.append("cost: ").append(result.getCost()).append(System.lineSeparator());
       outBuilder.append(">seq1").append(System.lineSeparator());
@@ -102,6 +138,22 @@ public final class BioseqCli implements Runnable {
       outBuilder.append(">seq2").append(System.lineSeparator());
       outBuilder.append(TextWrap.wrap(result.getAligned2(), wrap));
       writeOutput(outBuilder.toString());
+      reportTiming(elapsedNs);
+    }
+
+    /**
+     * Prints the kernel runtime line when {@code --timing} is set.
+     *
+     * <p>The line goes to stderr so scripts can discard the (potentially large) alignment output on
+     * stdout and still parse a runtime that excludes JVM startup, argument parsing, and matrix I/O.
+     *
+     * @param elapsedNs elapsed nanoseconds of {@code computeCost}, or of {@code align} (DP plus
+     *     traceback and aligned-string construction) in {@code --traceback} mode
+     */
+    private void reportTiming(long elapsedNs) {
+      if (timing) {
+        System.err.println("runtime_ns=" + elapsedNs);
+      }
     }
   }
 
@@ -166,6 +218,128 @@ public final class BioseqCli implements Runnable {
     }
   }
 
+  @Command(name = "server", mixinStandardHelpOptions = true,
+      description = {
+          "Serve timed linear-gap cost requests from stdin in one long-lived JVM.",
+          "Each input line is: threads<TAB>seq1<TAB>seq2[<TAB>repeats]",
+          "Each reply line is: OK <elapsed_ns>[,<elapsed_ns>...] <cost>  or  ERR <message>"})
+  static final class ServerCommand implements Runnable {
+    @Spec
+    CommandSpec spec;
+
+    @Option(names = "--matrix", required = true, description = "Path to score matrix file.")
+    Path matrixPath;
+
+    @Option(names = "--gap", required = true, description = "Linear gap penalty (non-negative integer).")
+    int gap;
+
+    /**
+     * Executes the {@code server} request loop until stdin is closed.
+     *
+     * <p>Aligners are cached per thread count so wavefront pools and JIT-compiled code are reused
+     * across requests. Only the {@code computeCost} call is timed; request parsing and reply I/O
+     * are excluded from the reported elapsed time.
+     */
+    @Override
+    public void run() {
+      if (gap < 0) {
+        throw new CommandLine.ParameterException(spec.commandLine(), "--gap must be non-negative");
+      }
+      ScoreMatrix matrix = ScoreMatrix.fromPhylipLikeFile(matrixPath);
+      LinearGapCost gapCost = new LinearGapCost(gap);
+      Map<Integer, GlobalAligner<LinearGapCost>> aligners = new HashMap<>();
+      PrintStream out = System.out;
+
+      try (BufferedReader in = new BufferedReader(new InputStreamReader(System.in, StandardCharsets.UTF_8))) {
+        String line;
+        while ((line = in.readLine()) != null) {
+          if (line.isBlank()) {
+            continue;
+          }
+          out.println(handleRequest(line, matrix, gapCost, aligners));
+          out.flush();
+        }
+      } catch (IOException e) {
+        throw new CommandLine.ExecutionException(spec.commandLine(), "Failed to read server requests", e);
+      } finally {
+        for (GlobalAligner<LinearGapCost> aligner : aligners.values()) {
+          if (aligner instanceof WavefrontLinearAligner wavefront) {
+            wavefront.shutdown();
+          }
+        }
+      }
+    }
+
+    /**
+     * Parses and runs one server request.
+     *
+     * <p>The optional {@code repeats} field runs the same alignment several times within one
+     * request, so a client can collect many timings without resending the sequences.
+     *
+     * @param line raw request line ({@code threads<TAB>seq1<TAB>seq2[<TAB>repeats]})
+     * @param matrix score matrix shared by all requests
+     * @param gapCost linear gap cost shared by all requests
+     * @param aligners per-thread-count aligner cache
+     * @return reply line ({@code OK <elapsed_ns>[,<elapsed_ns>...] <cost>} or {@code ERR <message>})
+     */
+    static String handleRequest(
+        String line,
+        ScoreMatrix matrix,
+        LinearGapCost gapCost,
+        Map<Integer, GlobalAligner<LinearGapCost>> aligners) {
+      String[] fields = line.split("\t", -1);
+      if (fields.length != 3 && fields.length != 4) {
+        return "ERR expected 3 or 4 tab-separated fields: threads, seq1, seq2[, repeats]";
+      }
+
+      int threads;
+      try {
+        threads = Integer.parseInt(fields[0].trim());
+      } catch (NumberFormatException e) {
+        return "ERR threads must be an integer, got: " + fields[0];
+      }
+      if (threads <= 0) {
+        return "ERR threads must be positive, got: " + threads;
+      }
+
+      int repeats = 1;
+      if (fields.length == 4) {
+        try {
+          repeats = Integer.parseInt(fields[3].trim());
+        } catch (NumberFormatException e) {
+          return "ERR repeats must be an integer, got: " + fields[3];
+        }
+        if (repeats <= 0) {
+          return "ERR repeats must be positive, got: " + repeats;
+        }
+      }
+
+      Sequence seq1 = Sequence.of(fields[1].trim());
+      Sequence seq2 = Sequence.of(fields[2].trim());
+      try {
+        GlobalAligner<LinearGapCost> aligner = aligners.computeIfAbsent(threads, BioseqCli::linearAligner);
+        long[] elapsedNs = new long[repeats];
+        int cost = 0;
+        for (int r = 0; r < repeats; r++) {
+          long start = System.nanoTime();
+          cost = aligner.computeCost(seq1, seq2, matrix, gapCost);
+          elapsedNs[r] = System.nanoTime() - start;
+        }
+
+        StringBuilder reply = new StringBuilder("OK ");
+        for (int r = 0; r < repeats; r++) {
+          if (r > 0) {
+            reply.append(',');
+          }
+          reply.append(elapsedNs[r]);
+        }
+        return reply.append(' ').append(cost).toString();
+      } catch (RuntimeException e) {
+        return "ERR " + (e.getMessage() != null ? e.getMessage() : e.getClass().getSimpleName());
+      }
+    }
+  }
+
   abstract static class BaseCommand {
     @Spec
     CommandSpec spec;
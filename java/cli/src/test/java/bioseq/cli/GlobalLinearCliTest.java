@@ -0,0 +1,93 @@
+package bioseq.cli;
+
+import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertTrue;
+
+import java.io.ByteArrayOutputStream;
+import java.io.PrintStream;
+import java.lang.reflect.Constructor;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.io.TempDir;
+import picocli.CommandLine;
+
+class GlobalLinearCliTest {
+  @TempDir
+  Path tempDir;
+
+  @Test
+  void timingOptionPrintsKernelRuntimeToStderr() throws Exception {
+    Path matrixPath = tempDir.resolve("single-a-matrix.txt");
+    Files.writeString(matrixPath, """
+        1
+        A 0
+        """);
+
+    ByteArrayOutputStream outBuffer = new ByteArrayOutputStream();
+    ByteArrayOutputStream errBuffer = new ByteArrayOutputStream();
+    PrintStream originalOut = System.out;
+    PrintStream originalErr = System.err;
+    try (PrintStream capture = new PrintStream(outBuffer, true, StandardCharsets.UTF_8);
+        PrintStream errCapture = new PrintStream(errBuffer, true, StandardCharsets.UTF_8)) {
+      System.setOut(capture);
+      System.setErr(errCapture);
+
+      Constructor<BioseqCli> constructor = BioseqCli.class.getDeclaredConstructor();
+      constructor.setAccessible(true);
+      BioseqCli rootCommand = constructor.newInstance();
+
+      int exitCode = new CommandLine(rootCommand).execute(
+          "global_linear",
+          "--seq1", "AA",
+          "--seq2", "A",
+          "--matrix", matrixPath.toString(),
+          "--gap", "2",
+          "--timing");
+
+      assertEquals(0, exitCode);
+    } finally {
+      System.setOut(originalOut);
+      System.setErr(originalErr);
+    }
+
+    assertEquals("2", outBuffer.toString(StandardCharsets.UTF_8).strip());
+    String timingLine = errBuffer.toString(StandardCharsets.UTF_8).strip();
+    assertTrue(timingLine.matches("runtime_ns=\\d+"), timingLine);
+  }
+
+  @Test
+  void quietOptionSuppressesAlignmentOutput() throws Exception {
+    Path matrixPath = tempDir.resolve("single-a-matrix.txt");
+    Files.writeString(matrixPath, """
+        1
+        A 0
+        """);
+
+    ByteArrayOutputStream outBuffer = new ByteArrayOutputStream();
+    PrintStream originalOut = System.out;
+    try (PrintStream capture = new PrintStream(outBuffer, true, StandardCharsets.UTF_8)) {
+      System.setOut(capture);
+
+      Constructor<BioseqCli> constructor = BioseqCli.class.getDeclaredConstructor();
+      constructor.setAccessible(true);
+      BioseqCli rootCommand = constructor.newInstance();
+
+      int exitCode = new CommandLine(rootCommand).execute(
+          "global_linear",
+          "--seq1", "AA",
+          "--seq2", "A",
+          "--matrix", matrixPath.toString(),
+          "--gap", "2",
+          "--traceback",
+          "--quiet");
+
+      assertEquals(0, exitCode);
+    } finally {
+      System.setOut(originalOut);
+    }
+
+    assertEquals("", outBuffer.toString(StandardCharsets.UTF_8));
+  }
+}
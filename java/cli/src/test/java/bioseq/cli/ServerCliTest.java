@@ -0,0 +1,67 @@
+package bioseq.cli;
+
+import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertTrue;
+
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.InputStream;
+import java.io.PrintStream;
+import java.lang.reflect.Constructor;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.io.TempDir;
+import picocli.CommandLine;
+
+class ServerCliTest {
+  @TempDir
+  Path tempDir;
+
+  @Test
+  void serverAnswersEachRequestLineWithTimingAndCost() throws Exception {
+    Path matrixPath = tempDir.resolve("dna-matrix.txt");
+    Files.writeString(matrixPath, """
+        4
+        A 0 2 5 2
+        C 2 0 2 5
+        G 5 2 0 2
+        T 2 5 2 0
+        """);
+
+    String requests = "1\tACGT\tACGT\n"
+        + "\n"
+        + "2\tACGT\tAGT\n"
+        + "1\tACGT\tAGT\t3\n"
+        + "not-a-number\tA\tA\n";
+    ByteArrayOutputStream outBuffer = new ByteArrayOutputStream();
+    InputStream originalIn = System.in;
+    PrintStream originalOut = System.out;
+    try (PrintStream capture = new PrintStream(outBuffer, true, StandardCharsets.UTF_8)) {
+      System.setIn(new ByteArrayInputStream(requests.getBytes(StandardCharsets.UTF_8)));
+      System.setOut(capture);
+
+      Constructor<BioseqCli> constructor = BioseqCli.class.getDeclaredConstructor();
+      constructor.setAccessible(true);
+      BioseqCli rootCommand = constructor.newInstance();
+
+      int exitCode = new CommandLine(rootCommand).execute(
+          "server",
+          "--matrix", matrixPath.toString(),
+          "--gap", "2");
+
+      assertEquals(0, exitCode);
+    } finally {
+      System.setIn(originalIn);
+      System.setOut(originalOut);
+    }
+
+    String[] replies = outBuffer.toString(StandardCharsets.UTF_8).strip().split("\\R");
+    assertEquals(4, replies.length);
+    assertTrue(replies[0].matches("OK \\d+ 0"), replies[0]);
+    assertTrue(replies[1].matches("OK \\d+ 2"), replies[1]);
+    assertTrue(replies[2].matches("OK \\d+,\\d+,\\d+ 2"), replies[2]);
+    assertTrue(replies[3].startsWith("ERR "), replies[3]);
+  }
+}
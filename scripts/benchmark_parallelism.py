@@ -5,53 +5,76 @@ Benchmark wavefront parallelism for global linear alignment.
 This script is intended to be run from the repository root:
     python scripts/benchmark_parallelism.py
 
+To regenerate only the plots from the existing CSV (no Java, no measurements):
+    python scripts/benchmark_parallelism.py --plot-only
+
 Workflow:
-1. Build the CLI jar (skipping tests).
-2. Run two warmup alignments (ignored in final metrics).
-3. Measure runtime for multiple sequence lengths and thread counts.
+1. Build the CLI jar (skipping tests) unless it is newer than its sources, and
+   create an AppCDS class-data archive for it so every JVM starts faster.
+2. Measure the 1-thread baseline for every sequence length, one at a time.
+3. Pack the multi-thread configurations into batches whose thread counts fit the
+   available CPUs and measure each batch concurrently, pinning every JVM to a
+   disjoint CPU set with `taskset` (batches run one job at a time when `taskset`
+   is unavailable).
 4. Save results to CSV and (if matplotlib is available) produce two plots.
+
+Each measurement fork runs in its own long-lived `server` JVM. A short warmup
+alignment at the measured length (capped at WARMUP_LENGTH) and the measured thread
+count loads the aligner that the measurement uses; the measured alignment itself is
+then repeated until its runtime reaches a steady state (see `warmup_until_steady`).
+Timings are taken inside the JVM around the DP kernel only.
+
+Every configuration is measured in FORKS fresh JVMs with REPEATS_PER_FORK timed
+runs each. The reported median is the median of the per-fork medians, so
+run-to-run JIT variance between JVM instances is captured rather than hidden.
 """
 
 from __future__ import annotations
 
+import argparse
 import csv
+import hashlib
+import inspect
+import json
+import os
 import random
+import shutil
 import statistics
 import subprocess
 import sys
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Deque, Dict, List, Optional, Sequence, TextIO, Tuple
 
 
-THREAD_COUNTS = [1, 2, 4, 8]
+THREAD_COUNTS = [1, 2, 4, 8, 16]
 SEQUENCE_LENGTHS = [5000, 10000, 15000]
-WARMUP_LENGTH = 1000
-WARMUP_RUNS = 2
-REPEATS = 3
+WARMUP_LENGTH = 2000
+WARMUP_MAX_SECONDS = 30.0
+WARMUP_WINDOW = 5
+WARMUP_CV_THRESHOLD = 0.05
+FORKS = 3
+REPEATS_PER_FORK = 3
 GAP_PENALTY = 2
+# Longer than the wavefront aligner's PARALLEL_CELL_THRESHOLD (512), so the AppCDS dump
+# session reaches the parallel anti-diagonal branch and archives its stream/ForkJoin classes.
+CDS_DUMP_LENGTH = 600
+# Fixed GC for every JVM: pinning to one CPU would otherwise make ergonomics pick SerialGC
+# for the baseline while multi-thread runs use G1.
+GC_FLAGS = ["-XX:+UseG1GC"]
 DNA_ALPHABET = "ACGT"
-CSV_COLUMNS = ["length", "threads", "median_seconds", "speedup"]
+CSV_COLUMNS = ["length", "threads", "min_seconds", "median_seconds", "speedup"]
+CLI_MODULES = ["core", "pairwise-alignment", "cli"]
 
 
 def repo_root() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
-def build_cli_jar(root: Path) -> Path:
-    """Build the CLI jar and return the path to the shaded jar."""
-    java_dir = root / "java"
-    if sys.platform.startswith("win"):
-        mvnw = java_dir / "mvnw.cmd"
-        cmd = [str(mvnw), "-q", "-pl", "cli", "-am", "package", "-DskipTests"]
-    else:
-        mvnw = java_dir / "mvnw"
-        cmd = [str(mvnw), "-q", "-pl", "cli", "-am", "package", "-DskipTests"]
-
-    print("Building CLI jar...")
-    subprocess.run(cmd, cwd=java_dir, check=True)
-
-    target_dir = root / "java" / "cli" / "target"
+def find_cli_jar(target_dir: Path) -> Optional[Path]:
+    """Return the shaded CLI jar in `target_dir`, or None if it has not been built."""
     preferred = target_dir / "bioseq-cli.jar"
     if preferred.exists():
         return preferred
@@ -63,222 +86,601 @@ def build_cli_jar(root: Path) -> Path:
         for p in candidates
         if "original-" not in p.name and not p.name.endswith("-sources.jar") and not p.name.endswith("-javadoc.jar")
     ]
-    if not filtered:
+    return filtered[0] if filtered else None
+
+
+def newest_cli_input_mtime(java_dir: Path) -> float:
+    """Return the newest mtime among the POMs and Java sources the CLI jar is built from."""
+    inputs = [java_dir / "pom.xml"]
+    for module in CLI_MODULES:
+        inputs.append(java_dir / module / "pom.xml")
+        inputs.extend((java_dir / module / "src" / "main").rglob("*"))
+    return max((p.stat().st_mtime for p in inputs if p.is_file()), default=0.0)
+
+
+def build_cli_jar(root: Path) -> Path:
+    """Build the CLI jar unless it is newer than all of its inputs, and return its path."""
+    java_dir = root / "java"
+    target_dir = java_dir / "cli" / "target"
+
+    existing = find_cli_jar(target_dir)
+    if existing is not None and existing.stat().st_mtime > newest_cli_input_mtime(java_dir):
+        print("CLI jar is up to date; skipping build.")
+        return existing
+
+    # Prefer the Maven daemon when installed; it avoids a cold Maven JVM per build.
+    mvnd = shutil.which("mvnd")
+    if mvnd is not None:
+        mvn = mvnd
+    elif sys.platform.startswith("win"):
+        mvn = str(java_dir / "mvnw.cmd")
+    else:
+        mvn = str(java_dir / "mvnw")
+    cmd = [mvn, "-q", "-pl", "cli", "-am", "package", "-DskipTests"]
+
+    print("Building CLI jar...")
+    subprocess.run(cmd, cwd=java_dir, check=True)
+
+    built = find_cli_jar(target_dir)
+    if built is None:
         raise FileNotFoundError(f"Could not find built CLI jar in {target_dir}")
-    return filtered[0]
+    return built
+
+
+def java_command(cds_archive: Optional[Path] = None) -> List[str]:
+    """
+    Return the `java` launcher prefix, using the AppCDS archive when one is available.
+
+    JVM log output is moved from stdout to stderr: a warning such as an unusable CDS
+    archive would otherwise be read as a server reply.
+    """
+    cmd = ["java", "-Xlog:disable", "-Xlog:all=warning:stderr"]
+    if cds_archive is not None:
+        cmd += [f"-XX:SharedArchiveFile={cds_archive}", "-Xshare:auto"]
+    return cmd
+
+
+def java_version() -> str:
+    """Return the `java -version` banner identifying the JVM that will run the benchmark."""
+    completed = subprocess.run(["java", "-version"], capture_output=True, text=True)
+    return (completed.stderr or completed.stdout).strip()
+
+
+def ensure_cds_archive(root: Path, jar_path: Path, matrix_path: Path) -> Optional[Path]:
+    """
+    Create an AppCDS archive for the CLI jar unless an up-to-date one already exists.
+
+    The archive is dumped at exit from a short `server` session that runs one sequential
+    and one wavefront request on CDS_DUMP_LENGTH-long sequences. That is long enough for
+    the wavefront request to take its parallel branch, so both aligner paths, including
+    the parallel-stream and ForkJoin task classes, have their classes archived.
+    Returns None when the JVM cannot create the archive; servers then start without it.
+
+    The archive is tied to the JVM that dumped it, so the `java -version` banner is stored
+    in a `.jvm` sidecar file and a different JVM (e.g. after a JDK upgrade) triggers a rebuild.
+    """
+    archive = jar_path.with_suffix(".jsa")
+    identity_path = archive.with_name(archive.name + ".jvm")
+    identity = java_version()
+    if (
+        archive.exists()
+        and archive.stat().st_mtime > jar_path.stat().st_mtime
+        and identity_path.exists()
+        and identity_path.read_text(encoding="utf-8") == identity
+    ):
+        return archive
+
+    print("Creating AppCDS archive...")
+    archive.unlink(missing_ok=True)
+    cmd = java_command() + GC_FLAGS + [
+        f"-XX:ArchiveClassesAtExit={archive}",
+        "-jar",
+        str(jar_path),
+        "server",
+        "--matrix",
+        str(matrix_path),
+        "--gap",
+        str(GAP_PENALTY),
+    ]
+    rng = random.Random(CDS_DUMP_LENGTH)
+    seq1 = random_dna(CDS_DUMP_LENGTH, rng)
+    seq2 = random_dna(CDS_DUMP_LENGTH, rng)
+    requests = f"1\t{seq1}\t{seq2}\n{max(THREAD_COUNTS)}\t{seq1}\t{seq2}\n"
+    completed = subprocess.run(
+        cmd,
+        cwd=root,
+        input=requests,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if completed.returncode != 0 or not archive.exists():
+        stderr_tail = completed.stderr[-800:] if completed.stderr else ""
+        print(f"Could not create AppCDS archive; continuing without it.\n{stderr_tail}")
+        return None
+    identity_path.write_text(identity, encoding="utf-8")
+    return archive
 
 
 def random_dna(length: int, rng: random.Random) -> str:
     """Generate a random DNA sequence of the requested length."""
-    return "".join(rng.choice(DNA_ALPHABET) for _ in range(length))
+    return "".join(rng.choices(DNA_ALPHABET, k=length))
+
 
+def available_cpus() -> List[int]:
+    """Return the CPU ids this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
 
-def run_alignment(
+
+def physical_core_cpus(cpus: List[int]) -> List[int]:
+    """
+    Return one logical CPU per physical core among `cpus`.
+
+    Uses the Linux sysfs topology (SMT siblings share a `thread_siblings_list`), then
+    psutil's physical core count, and finally treats every logical CPU as a core.
+    """
+    chosen: List[int] = []
+    seen_siblings = set()
+    try:
+        for cpu in cpus:
+            siblings_path = Path(f"/sys/devices/system/cpu/cpu{cpu}/topology/thread_siblings_list")
+            siblings = siblings_path.read_text(encoding="utf-8").strip()
+            if siblings not in seen_siblings:
+                seen_siblings.add(siblings)
+                chosen.append(cpu)
+        return chosen
+    except OSError:
+        pass
+
+    try:
+        import psutil
+    except Exception:  # noqa: BLE001
+        print("Physical core layout unknown; treating every logical CPU as a core.")
+        return cpus
+    physical = psutil.cpu_count(logical=False) or len(cpus)
+    return cpus[:physical]
+
+
+def usable_thread_counts(physical_cores: int) -> List[int]:
+    """Drop thread counts above the physical core count, which would measure SMT contention."""
+    usable = [t for t in THREAD_COUNTS if t <= physical_cores]
+    for threads in THREAD_COUNTS:
+        if threads > physical_cores:
+            print(
+                f"Warning: skipping threads={threads}; only {physical_cores} physical core(s) available, "
+                "so the run would measure SMT/oversubscription contention rather than the algorithm."
+            )
+    return usable
+
+
+def pack_batches(jobs: List[Tuple[int, int]], cpu_budget: int) -> List[List[Tuple[int, int]]]:
+    """
+    Group (length, threads) jobs into concurrent batches using first-fit-decreasing.
+
+    The summed thread count of a batch never exceeds `cpu_budget`, except for a job that
+    alone needs more threads than the budget. A budget of 0 yields one job per batch.
+    """
+    batches: List[List[Tuple[int, int]]] = []
+    used: List[int] = []
+    for job in sorted(jobs, key=lambda j: (-j[1], j[0])):
+        threads = job[1]
+        for idx, batch in enumerate(batches):
+            if used[idx] + threads <= cpu_budget:
+                batch.append(job)
+                used[idx] += threads
+                break
+        else:
+            batches.append([job])
+            used.append(threads)
+    return batches
+
+
+def start_alignment_server(
     root: Path,
     jar_path: Path,
     matrix_path: Path,
-    seq1: str,
-    seq2: str,
     threads: int,
-) -> float:
-    """Run one CLI alignment and return wall-clock runtime in seconds."""
-    cmd = [
-        "java",
+    cpus: Optional[Sequence[int]] = None,
+    cds_archive: Optional[Path] = None,
+) -> subprocess.Popen:
+    """
+    Start the CLI `server` subcommand, optionally pinned to `cpus` with taskset.
+
+    The common ForkJoinPool is sized to `threads`: when a JVM sees exactly `threads`
+    processors, the wavefront aligner uses the common pool, whose default parallelism
+    is one less than the processor count.
+    """
+    cmd = java_command(cds_archive) + GC_FLAGS + [
+        f"-Djava.util.concurrent.ForkJoinPool.common.parallelism={threads}",
         "-jar",
         str(jar_path),
-        "global_linear",
-        "--seq1",
-        seq1,
-        "--seq2",
-        seq2,
+        "server",
         "--matrix",
         str(matrix_path),
         "--gap",
         str(GAP_PENALTY),
-        "--threads",
-        str(threads),
     ]
-
-    start = time.perf_counter()
-    completed = subprocess.run(
+    if cpus:
+        cmd = ["taskset", "-c", ",".join(str(cpu) for cpu in cpus)] + cmd
+    return subprocess.Popen(
         cmd,
         cwd=root,
-        capture_output=True,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
         text=True,
+        bufsize=1,
     )
-    elapsed = time.perf_counter() - start
 
-    if completed.returncode != 0:
-        stdout_tail = completed.stdout[-800:] if completed.stdout else ""
-        stderr_tail = completed.stderr[-800:] if completed.stderr else ""
-        raise RuntimeError(
-            "global_linear command failed.\n"
-            f"Return code: {completed.returncode}\n"
-            f"STDOUT (tail):\n{stdout_tail}\n"
-            f"STDERR (tail):\n{stderr_tail}"
-        )
 
-    return elapsed
+def stop_alignment_server(server: subprocess.Popen) -> None:
+    """Close the request stream and wait for the server JVM to exit."""
+    if server.stdin is not None:
+        server.stdin.close()
+    try:
+        server.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        server.kill()
+        server.wait()
+
+
+def run_alignments(server: subprocess.Popen, seq1: str, seq2: str, threads: int, repeats: int) -> List[float]:
+    """Run one alignment `repeats` times in a single server request; return in-JVM kernel runtimes in seconds."""
+    assert server.stdin is not None and server.stdout is not None
+    server.stdin.write(f"{threads}\t{seq1}\t{seq2}\t{repeats}\n")
+    server.stdin.flush()
+
+    reply = server.stdout.readline()
+    if not reply:
+        raise RuntimeError(f"Alignment server exited unexpectedly (return code: {server.poll()})")
+    fields = reply.split()
+    if fields[0] != "OK":
+        raise RuntimeError(f"Alignment server request failed: {reply.strip()}")
+    return [int(ns) / 1e9 for ns in fields[1].split(",")]
+
 
+def run_alignment(server: subprocess.Popen, seq1: str, seq2: str, threads: int) -> float:
+    """Send one alignment request to the server and return the in-JVM kernel runtime in seconds."""
+    return run_alignments(server, seq1, seq2, threads, 1)[0]
 
-def warmup_runs(root: Path, jar_path: Path, matrix_path: Path) -> None:
-    """Run a couple of short alignments to warm up JVM/class loading/JIT."""
-    print("Running warmup (ignored in analysis)...")
-    warmup_threads = [1, max(THREAD_COUNTS)]
+
+def warmup_runs(server: subprocess.Popen, lengths: Sequence[int], thread_counts: Sequence[int]) -> None:
+    """
+    Run one short alignment per (length, threads) pair to warm up class loading/JIT.
+
+    Each warmup uses the measured length capped at WARMUP_LENGTH, so the kernel
+    exercises the same code paths as the measurement without its full cost.
+    """
     rng = random.Random(2026)
-    for run_idx in range(WARMUP_RUNS):
-        threads = warmup_threads[run_idx % len(warmup_threads)]
-        seq1 = random_dna(WARMUP_LENGTH, rng)
-        seq2 = random_dna(WARMUP_LENGTH, rng)
-        _ = run_alignment(root, jar_path, matrix_path, seq1, seq2, threads)
+    for length in lengths:
+        warmup_length = min(length, WARMUP_LENGTH)
+        for threads in thread_counts:
+            seq1 = random_dna(warmup_length, rng)
+            seq2 = random_dna(warmup_length, rng)
+            _ = run_alignment(server, seq1, seq2, threads)
 
 
-def write_csv(csv_path: Path, rows: List[Dict[str, float]]) -> None:
-    csv_path.parent.mkdir(parents=True, exist_ok=True)
-    with csv_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(
-                {
-                    "length": int(row["length"]),
-                    "threads": int(row["threads"]),
-                    "median_seconds": f"{row['median_seconds']:.6f}",
-                    "speedup": f"{row['speedup']:.6f}",
-                }
-            )
+def warmup_until_steady(
+    server: subprocess.Popen,
+    seq1: str,
+    seq2: str,
+    threads: int,
+    max_seconds: float = WARMUP_MAX_SECONDS,
+    window: int = WARMUP_WINDOW,
+    cv_threshold: float = WARMUP_CV_THRESHOLD,
+) -> Tuple[int, float]:
+    """
+    Repeat the measured alignment until its runtime stabilizes.
+
+    Stops once the coefficient of variation (stdev / mean) over the last `window`
+    runtimes drops below `cv_threshold`, or when `max_seconds` of wall-clock time
+    have elapsed. Returns the number of warmup runs and the last observed CV.
+    """
+    recent: Deque[float] = deque(maxlen=window)
+    cv = float("inf")
+    runs = 0
+    start = time.perf_counter()
+    while True:
+        recent.append(run_alignment(server, seq1, seq2, threads))
+        runs += 1
+        if len(recent) == window:
+            mean = statistics.fmean(recent)
+            cv = statistics.stdev(recent) / mean if mean > 0 else 0.0
+            if cv < cv_threshold:
+                break
+        if time.perf_counter() - start >= max_seconds:
+            break
+    return runs, cv
+
+
+def measure_configuration(
+    root: Path,
+    jar_path: Path,
+    matrix_path: Path,
+    seqs: Tuple[str, str],
+    threads: int,
+    cpus: Optional[Sequence[int]] = None,
+    cds_archive: Optional[Path] = None,
+) -> List[List[float]]:
+    """
+    Measure one (sequence pair, threads) point in FORKS fresh server JVMs.
+
+    Each fork warms up and then times REPEATS_PER_FORK runs. Returns the timed
+    runtimes grouped per fork.
+    """
+    seq1, seq2 = seqs
+    length = len(seq1)
+    fork_runtimes: List[List[float]] = []
+    for fork in range(FORKS):
+        server = start_alignment_server(root, jar_path, matrix_path, threads, cpus, cds_archive)
+        try:
+            warmup_runs(server, [length], [threads])
+            warmup_count, cv = warmup_until_steady(server, seq1, seq2, threads)
+            fork_runtimes.append(run_alignments(server, seq1, seq2, threads, REPEATS_PER_FORK))
+        finally:
+            stop_alignment_server(server)
+        print(
+            f"  length={length}, threads={threads}, fork {fork + 1}/{FORKS}: "
+            f"steady after {warmup_count} warmup runs (CV={cv:.3f})"
+        )
+
+    fork_medians = [median_of(runtimes) for runtimes in fork_runtimes]
+    print(
+        f"  length={length}, threads={threads}: max/min fork median ratio "
+        f"{max(fork_medians) / min(fork_medians):.3f} (run-to-run noise)"
+    )
+    return fork_runtimes
+
+
+def median_of(values: Sequence[float]) -> float:
+    """Median of a small sample (FORKS and REPEATS_PER_FORK are tiny, so a plain sort beats statistics.median)."""
+    ordered = sorted(values)
+    mid = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[mid]
+    return 0.5 * (ordered[mid - 1] + ordered[mid])
+
+
+def write_csv_row(writer: Any, handle: TextIO, row: Dict[str, float]) -> None:
+    """Append one result row (in CSV_COLUMNS order) and flush it so partial sweeps survive a crash."""
+    writer.writerow(
+        (
+            int(row["length"]),
+            int(row["threads"]),
+            f"{row['min_seconds']:.6f}",
+            f"{row['median_seconds']:.6f}",
+            f"{row['speedup']:.6f}",
+        )
+    )
+    handle.flush()
+
+
+def read_csv_rows(csv_path: Path) -> List[Dict[str, float]]:
+    """Load previously written result rows (any column layout this script has produced)."""
+    with csv_path.open(newline="", encoding="utf-8") as f:
+        return [{key: float(value) for key, value in row.items()} for row in csv.DictReader(f)]
+
+
+def plots_digest(rows: List[Dict[str, float]]) -> str:
+    """
+    SHA-256 of everything the plots depend on: the rows at CSV precision (independent of
+    measurement order) and the source of `make_plots`, so plotting-code edits invalidate it.
+    """
+    canonical = sorted(
+        [{key: round(float(value), 6) for key, value in row.items()} for row in rows],
+        key=lambda r: (r["length"], r["threads"]),
+    )
+    payload = json.dumps(canonical, sort_keys=True) + inspect.getsource(make_plots)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def write_plots(rows: List[Dict[str, float]], csv_path: Path, speedup_png: Path, runtime_png: Path) -> bool:
+    """Run `make_plots` unless the existing PNGs were produced from the same rows and code."""
+    digest = plots_digest(rows)
+    digest_path = csv_path.with_suffix(".sha256")
+    if (
+        digest_path.exists()
+        and digest_path.read_text(encoding="utf-8") == digest
+        and speedup_png.exists()
+        and runtime_png.exists()
+    ):
+        print("Rows and plotting code unchanged; keeping existing plots.")
+        return True
+
+    plotted = make_plots(rows, speedup_png, runtime_png)
+    if plotted:
+        digest_path.write_text(digest, encoding="utf-8")
+    return plotted
 
 
 def make_plots(rows: List[Dict[str, float]], speedup_png: Path, runtime_png: Path) -> bool:
     """Generate speedup/runtime plots. Returns False when matplotlib is unavailable."""
     try:
         import matplotlib.pyplot as plt
+        import numpy as np
     except Exception as exc:  # noqa: BLE001
         print(f"matplotlib is unavailable ({exc}); skipping plot generation.")
         return False
 
     speedup_png.parent.mkdir(parents=True, exist_ok=True)
 
-    # Group points by sequence length.
-    grouped: Dict[int, List[Dict[str, float]]] = {}
-    for row in rows:
-        grouped.setdefault(int(row["length"]), []).append(row)
-    for length_rows in grouped.values():
-        length_rows.sort(key=lambda r: int(r["threads"]))
+    # Marshal rows into one structured array sorted by (length, threads).
+    data = np.array(
+        [(int(r["length"]), int(r["threads"]), float(r["median_seconds"]), float(r["speedup"])) for r in rows],
+        dtype=[("length", "i4"), ("threads", "i4"), ("median", "f8"), ("speedup", "f8")],
+    )
+    data.sort(order=["length", "threads"])
 
     plt.style.use("seaborn-v0_8-whitegrid")
+    speedup_fig, speedup_ax = plt.subplots(figsize=(8.5, 5.5))
+    runtime_fig, runtime_ax = plt.subplots(figsize=(8.5, 5.5))
+
+    # One pass per length draws both the speedup and the runtime curve.
+    for length in np.unique(data["length"]):
+        points = data[data["length"] == length]
+        label = f"Length {length}"
+        speedup_ax.plot(points["threads"], points["speedup"], marker="o", linewidth=2, label=label)
+        runtime_ax.plot(points["threads"], points["median"], marker="o", linewidth=2, label=label)
 
     # Plot 1: speedup curves with ideal linear reference.
-    fig, ax = plt.subplots(figsize=(8.5, 5.5))
-    for length in sorted(grouped):
-        x = [int(r["threads"]) for r in grouped[length]]
-        y = [float(r["speedup"]) for r in grouped[length]]
-        ax.plot(x, y, marker="o", linewidth=2, label=f"Length {length}")
-
-    ideal_x = THREAD_COUNTS
-    ideal_y = THREAD_COUNTS
-    ax.plot(ideal_x, ideal_y, linestyle="--", color="black", linewidth=1.5, label="Ideal linear speedup")
-    ax.set_title("Wavefront Parallelism Speedup (Global Linear Alignment)")
-    ax.set_xlabel("Threads")
-    ax.set_ylabel("Speedup")
-    ax.set_xticks(THREAD_COUNTS)
-    ax.legend()
-    ax.grid(True, linestyle="--", alpha=0.6)
-    fig.tight_layout()
-    fig.savefig(speedup_png, dpi=200)
-    plt.close(fig)
+    thread_counts = np.unique(data["threads"])
+    speedup_ax.plot(
+        thread_counts, thread_counts, linestyle="--", color="black", linewidth=1.5, label="Ideal linear speedup"
+    )
+    speedup_ax.set_title("Wavefront Parallelism Speedup (Global Linear Alignment)")
+    speedup_ax.set_ylabel("Speedup")
 
     # Plot 2: runtime curves.
-    fig, ax = plt.subplots(figsize=(8.5, 5.5))
-    for length in sorted(grouped):
-        x = [int(r["threads"]) for r in grouped[length]]
-        y = [float(r["median_seconds"]) for r in grouped[length]]
-        ax.plot(x, y, marker="o", linewidth=2, label=f"Length {length}")
-
-    ax.set_title("Runtime vs Thread Count (Global Linear Alignment)")
-    ax.set_xlabel("Threads")
-    ax.set_ylabel("Runtime (seconds)")
-    ax.set_xticks(THREAD_COUNTS)
-    ax.legend()
-    ax.grid(True, linestyle="--", alpha=0.6)
-    fig.tight_layout()
-    fig.savefig(runtime_png, dpi=200)
-    plt.close(fig)
+    runtime_ax.set_title("Runtime vs Thread Count (Global Linear Alignment)")
+    runtime_ax.set_ylabel("Runtime (seconds)")
+
+    for fig, ax, png in ((speedup_fig, speedup_ax, speedup_png), (runtime_fig, runtime_ax, runtime_png)):
+        ax.set_xlabel("Threads")
+        ax.set_xticks(thread_counts)
+        ax.legend()
+        ax.grid(True, linestyle="--", alpha=0.6)
+        fig.tight_layout()
+        fig.savefig(png, dpi=200)
+        plt.close(fig)
     return True
 
 
 def print_summary(rows: List[Dict[str, float]]) -> None:
-    print("\nBenchmark summary (median of 3 runs):")
-    print(f"{'length':>8} {'threads':>8} {'median_seconds':>16} {'speedup':>10}")
+    print(f"\nBenchmark summary ({FORKS} forks x {REPEATS_PER_FORK} runs; median of per-fork medians):")
+    print(f"{'length':>8} {'threads':>8} {'min_seconds':>13} {'median_seconds':>16} {'speedup':>10}")
     for row in sorted(rows, key=lambda r: (int(r["length"]), int(r["threads"]))):
         print(
             f"{int(row['length']):>8} "
             f"{int(row['threads']):>8} "
+            f"{float(row['min_seconds']):>13.6f} "
             f"{float(row['median_seconds']):>16.6f} "
             f"{float(row['speedup']):>10.3f}"
         )
 
 
+def print_plot_paths(plotted: bool, speedup_png: Path, runtime_png: Path) -> None:
+    if plotted:
+        print(f"Speedup plot written to: {speedup_png}")
+        print(f"Runtime plot written to: {runtime_png}")
+    else:
+        print("Plots were not generated (matplotlib unavailable).")
+
+
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark wavefront parallelism for global linear alignment.")
+    parser.add_argument(
+        "--plot-only",
+        action="store_true",
+        help="Regenerate plots from the existing results CSV without building or measuring.",
+    )
+    args = parser.parse_args()
+
     root = repo_root()
+    csv_path = root / "results" / "parallelism_analysis.csv"
+    speedup_png = root / "results" / "parallelism_speedup.png"
+    runtime_png = root / "results" / "parallelism_runtime.png"
+
+    if args.plot_only:
+        if not csv_path.exists():
+            raise FileNotFoundError(f"Missing results CSV: {csv_path}")
+        plotted = write_plots(read_csv_rows(csv_path), csv_path, speedup_png, runtime_png)
+        print_plot_paths(plotted, speedup_png, runtime_png)
+        return
+
     matrix_path = root / "data" / "matrices" / "dna_example.txt"
     if not matrix_path.exists():
         raise FileNotFoundError(f"Missing matrix file: {matrix_path}")
 
     jar_path = build_cli_jar(root)
     print(f"Using CLI jar: {jar_path}")
-
-    warmup_runs(root, jar_path, matrix_path)
-
-    measurements: List[Dict[str, float]] = []
+    cds_archive = ensure_cds_archive(root, jar_path, matrix_path)
+
+    # Pin to one logical CPU per physical core so threads never share a core.
+    cpus = physical_core_cpus(available_cpus())
+    thread_counts = usable_thread_counts(len(cpus))
+    can_pin = shutil.which("taskset") is not None
+    if not can_pin:
+        print("taskset not found; measuring one configuration at a time.")
+
+    # One fixed-seed pair per length: every thread count aligns the same DP instance,
+    # so speedup reflects thread scaling only.
+    seq_cache: Dict[int, Tuple[str, str]] = {}
     for length in SEQUENCE_LENGTHS:
-        for threads in THREAD_COUNTS:
-            print(f"Benchmarking length={length}, threads={threads} ...")
-            # Fixed seed per (length, threads) makes runs reproducible.
-            rng = random.Random(length * 1000 + threads)
-            seq1 = random_dna(length, rng)
-            seq2 = random_dna(length, rng)
-
-            runtimes = []
-            for _ in range(REPEATS):
-                runtimes.append(run_alignment(root, jar_path, matrix_path, seq1, seq2, threads))
-            median_seconds = statistics.median(runtimes)
-            measurements.append(
-                {
-                    "length": float(length),
-                    "threads": float(threads),
-                    "median_seconds": float(median_seconds),
-                }
-            )
+        rng = random.Random(length)
+        seq_cache[length] = (random_dna(length, rng), random_dna(length, rng))
 
-    baseline_by_length: Dict[int, float] = {}
-    for row in measurements:
-        if int(row["threads"]) == 1:
-            baseline_by_length[int(row["length"])] = float(row["median_seconds"])
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Rows are written as soon as they are measured; speedup only needs the baseline,
+    # which is always measured first.
     rows_with_speedup: List[Dict[str, float]] = []
-    for row in measurements:
-        length = int(row["length"])
-        baseline = baseline_by_length[length]
-        speedup = baseline / float(row["median_seconds"])
-        row_with_speedup = dict(row)
-        row_with_speedup["speedup"] = speedup
-        rows_with_speedup.append(row_with_speedup)
+    baseline_by_length: Dict[int, float] = {}
 
-    csv_path = root / "results" / "parallelism_analysis.csv"
-    speedup_png = root / "results" / "parallelism_speedup.png"
-    runtime_png = root / "results" / "parallelism_runtime.png"
+    with csv_path.open("w", newline="", encoding="utf-8") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(CSV_COLUMNS)
+        csv_file.flush()
+
+        def record(length: int, threads: int, fork_runtimes: List[List[float]]) -> None:
+            median_seconds = median_of([median_of(runtimes) for runtimes in fork_runtimes])
+            if threads == 1:
+                baseline_by_length[length] = median_seconds
+            row = {
+                "length": float(length),
+                "threads": float(threads),
+                "min_seconds": float(min(min(runtimes) for runtimes in fork_runtimes)),
+                "median_seconds": float(median_seconds),
+                "speedup": baseline_by_length[length] / median_seconds,
+            }
+            rows_with_speedup.append(row)
+            write_csv_row(writer, csv_file, row)
+
+        # Baselines run alone so no co-runner perturbs the T1 reference.
+        for length in SEQUENCE_LENGTHS:
+            print(f"Benchmarking length={length}, threads=1 ...")
+            fork_runtimes = measure_configuration(
+                root, jar_path, matrix_path, seq_cache[length], 1, cpus[:1] if can_pin else None, cds_archive
+            )
+            record(length, 1, fork_runtimes)
+
+        parallel_jobs = [
+            (length, threads) for length in SEQUENCE_LENGTHS for threads in thread_counts if threads > 1
+        ]
+        for batch in pack_batches(parallel_jobs, len(cpus) if can_pin else 0):
+            assignments: List[Tuple[int, int, Optional[List[int]]]] = []
+            next_cpu = 0
+            for length, threads in batch:
+                job_cpus = None
+                if can_pin:
+                    job_cpus = cpus[next_cpu : next_cpu + threads] if threads <= len(cpus) else cpus
+                    next_cpu += threads
+                print(f"Benchmarking length={length}, threads={threads} (CPUs: {job_cpus or 'any'}) ...")
+                assignments.append((length, threads, job_cpus))
+
+            with ThreadPoolExecutor(max_workers=len(assignments)) as pool:
+                futures = {
+                    pool.submit(
+                        measure_configuration,
+                        root,
+                        jar_path,
+                        matrix_path,
+                        seq_cache[length],
+                        threads,
+                        job_cpus,
+                        cds_archive,
+                    ): (length, threads)
+                    for length, threads, job_cpus in assignments
+                }
+                for future in as_completed(futures):
+                    length, threads = futures[future]
+                    record(length, threads, future.result())
 
-    write_csv(csv_path, rows_with_speedup)
-    plotted = make_plots(rows_with_speedup, speedup_png, runtime_png)
+    plotted = write_plots(rows_with_speedup, csv_path, speedup_png, runtime_png)
     print_summary(rows_with_speedup)
 
     print(f"\nCSV written to: {csv_path}")
-    if plotted:
-        print(f"Speedup plot written to: {speedup_png}")
-        print(f"Runtime plot written to: {runtime_png}")
-    else:
-        print("Plots were not generated (matplotlib unavailable).")
+    print_plot_paths(plotted, speedup_png, runtime_png)
 
 
 if __name__ == "__main__":